@@ -5,13 +5,25 @@
 # ============================================================
 
 import os
+import matplotlib
+
+# False: batch run on the non-GUI Agg backend, figures are only saved.
+# True: also open them with plt.show() (set this in notebooks too).
+INTERACTIVE = False
+if not INTERACTIVE:
+    matplotlib.use("Agg")
+
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 from scipy import stats
 from statsmodels.stats.multitest import multipletests
 
+from plotting import draw_raincloud
+from style import STYLE
+from weights_io import PHASE_ORDER, WEEK_COLS, prepare
+from weights_stats import paired_t
+
 # ============================================================
 # PATHS
 # ============================================================
@@ -24,76 +36,36 @@ os.makedirs(OUT_DIR, exist_ok=True)
 # STYLE & COLORS (Nature / color-blind safe)
 # ============================================================
 
-sns.set(style="whitegrid", context="talk")
-plt.rcParams["pdf.fonttype"] = 42
-plt.rcParams["ps.fonttype"] = 42
+plt.rcParams.update(STYLE)
 
 PD_COLOR = "#D55E00"   # vermillion
 CO_COLOR = "#0072B2"   # blue
-PHASE_ORDER = ["Pre-DBS", "DBS", "Post-DBS"]
 
 # ============================================================
-# LOAD DATA
+# LOAD DATA + PHASE MEANS PER SUBJECT (cached, see weights_io)
 # ============================================================
 
-df = pd.read_excel(DATA_PATH)
-df.columns = ["Group"] + [f"Week_{i}" for i in range(1, 13)]
-
-# Assign subject IDs
-df["Subject"] = [f"PD_{i+1}" if i < 9 else f"CO_{i-8}" for i in range(len(df))]
-
-# ============================================================
-# LONG FORMAT
-# ============================================================
-
-df_long = df.melt(
-    id_vars=["Subject", "Group"],
-    var_name="Week",
-    value_name="Weight"
-)
-
-df_long["WeekNum"] = df_long["Week"].str.extract(r"(\d+)").astype(int)
-
-def phase_label(w):
-    if w <= 4:
-        return "Pre-DBS"
-    elif w <= 8:
-        return "DBS"
-    else:
-        return "Post-DBS"
-
-df_long["Phase"] = df_long["WeekNum"].apply(phase_label)
-
-# ============================================================
-# PHASE MEANS PER SUBJECT
-# ============================================================
-
-phase_means = (
-    df_long
-    .groupby(["Subject", "Group", "Phase"])["Weight"]
-    .mean()
-    .reset_index()
-)
+df, phase_means = prepare(DATA_PATH)
+# float32 week matrix for the trajectory plot only; the tables and tests
+# below use the float64 phase means
+W = df[WEEK_COLS].to_numpy(dtype=np.float32)
 
 # -------------------------
 # Supplementary Table S1
 # -------------------------
 phase_means.to_csv(
-    f"{OUT_DIR}/Table_S1_Weight_PhaseMeans.csv",
-    index=False
+    os.path.join(OUT_DIR, "Table_S1_Weight_PhaseMeans.csv"),
+    index=False,
+    lineterminator="\n"
 )
 
 # ============================================================
 # SUBJECT-LEVEL DBS EFFECTS (PD)
 # ============================================================
 
-pd_data = phase_means[phase_means["Group"] == "PD"]
+pd_mask = (df["Group"] == "PD").to_numpy(dtype=bool)
 
-subject_table = (
-    pd_data
-    .pivot_table(index="Subject", columns="Phase", values="Weight")
-    .reset_index()
-)
+subject_table = df.loc[pd_mask, ["Subject"] + PHASE_ORDER].reset_index(drop=True)
 
 subject_table["Delta_DBS_minus_Pre"] = subject_table["DBS"] - subject_table["Pre-DBS"]
 subject_table["Percent_Change"] = (
@@ -104,8 +76,9 @@ subject_table["Percent_Change"] = (
 # Supplementary Table S2
 # -------------------------
 subject_table.to_csv(
-    f"{OUT_DIR}/Table_S2_PD_SubjectLevel_WeightEffects.csv",
-    index=False
+    os.path.join(OUT_DIR, "Table_S2_PD_SubjectLevel_WeightEffects.csv"),
+    index=False,
+    lineterminator="\n"
 )
 
 # ============================================================
@@ -113,24 +86,26 @@ subject_table.to_csv(
 # ============================================================
 
 comparisons = [("Pre-DBS", "DBS"), ("DBS", "Post-DBS"), ("Pre-DBS", "Post-DBS")]
-stats_rows = []
-pvals = []
+phase1 = [a for a, _ in comparisons]
+phase2 = [b for _, b in comparisons]
 
-for a, b in comparisons:
-    x = subject_table[a].values
-    y = subject_table[b].values
-    t, p = stats.ttest_rel(x, y)
-    dz = (y - x).mean() / (y - x).std(ddof=1)
-    stats_rows.append([a, b, t, p, dz])
-    pvals.append(p)
+# Paired t-tests for all comparisons at once (one row per comparison),
+t_stat, dz = paired_t(
+    subject_table[phase1].to_numpy(dtype=np.float64).T,
+    subject_table[phase2].to_numpy(dtype=np.float64).T
+)
+pvals = 2 * stats.t.sf(np.abs(t_stat), len(subject_table) - 1)
 
 # Holm correction
 reject, pvals_corr, _, _ = multipletests(pvals, method="holm")
 
-posthoc_df = pd.DataFrame(
-    stats_rows,
-    columns=["Phase1", "Phase2", "t_stat", "p_raw", "Cohens_dz"]
-)
+posthoc_df = pd.DataFrame({
+    "Phase1": phase1,
+    "Phase2": phase2,
+    "t_stat": t_stat,
+    "p_raw": pvals,
+    "Cohens_dz": dz
+})
 posthoc_df["p_holm"] = pvals_corr
 posthoc_df["Significant"] = reject
 
@@ -138,8 +113,9 @@ posthoc_df["Significant"] = reject
 # Supplementary Table S3
 # -------------------------
 posthoc_df.to_csv(
-    f"{OUT_DIR}/Table_S3_PD_Posthoc_HolmCorrected.csv",
-    index=False
+    os.path.join(OUT_DIR, "Table_S3_PD_Posthoc_HolmCorrected.csv"),
+    index=False,
+    lineterminator="\n"
 )
 
 # ============================================================
@@ -158,28 +134,27 @@ print("\nFriedman test (PD): Chi² =", round(friedman_stat, 3), "p =", round(fri
 # FIGURE 1 – WEIGHT TRAJECTORIES (CLEAN LEGEND)
 # ============================================================
 
-plt.figure(figsize=(9,6))
+fig, ax = plt.subplots(figsize=(9,6))
 
-# Individual trajectories (no legend)
-sns.lineplot(
-    data=df_long,
-    x="WeekNum",
-    y="Weight",
-    hue="Group",
-    estimator=None,
-    alpha=0.25,
-    legend=False
-)
+weeks = np.arange(1, 13)
+group = df["Group"].to_numpy()
+group_colors = {"PD": PD_COLOR, "CO": CO_COLOR}
 
-# Mean trajectories (single legend)
-sns.lineplot(
-    data=df_long,
-    x="WeekNum",
-    y="Weight",
-    hue="Group",
-    linewidth=3,
-    palette={"PD": PD_COLOR, "CO": CO_COLOR}
-)
+# Individual trajectories (no legend)
+for row, grp in zip(W, group):
+    ax.plot(weeks, row, color=group_colors[grp], alpha=0.25)
+
+# Mean trajectories ± 95% CI (t(0.975, n - 1) × SEM, single legend)
+for grp in ["PD", "CO"]:
+    W_grp = W[group == grp]
+    n = np.sum(~np.isnan(W_grp), axis=0)   # animals weighed per week
+    m = np.nanmean(W_grp, axis=0)
+    sem = np.nanstd(W_grp, ddof=1, axis=0) / np.sqrt(n)
+    ax.plot(weeks, m, color=group_colors[grp], linewidth=3, label=grp)
+    ci = stats.t.ppf(0.975, n - 1) * sem
+    ax.fill_between(weeks, m - ci, m + ci,
+                    color=group_colors[grp], alpha=0.2, linewidth=0)
+ax.legend(title="Group")
 
 plt.axvspan(0.5, 4.5, alpha=0.1)
 plt.axvspan(4.5, 8.5, alpha=0.2)
@@ -189,59 +164,27 @@ plt.xlabel("Week")
 plt.ylabel("Body Weight (g)")
 plt.title("Body Weight Trajectories Across Experimental Phases")
 plt.tight_layout()
-plt.savefig(f"{OUT_DIR}/Fig_Weight_Trajectories.png", dpi=600)
-plt.show()
+plt.savefig(os.path.join(OUT_DIR, "Fig_Weight_Trajectories.png"), dpi=600)
+if INTERACTIVE:
+    plt.show()
+else:
+    plt.close()
 
 # ============================================================
 # FIGURE 2 – RAINCLOUD-STYLE PHASE COMPARISON (CLEAN)
 # ============================================================
 
-plt.figure(figsize=(7,5))
-
-# Violin
-sns.violinplot(
-    data=phase_means,
-    x="Phase",
-    y="Weight",
-    hue="Group",
-    order=PHASE_ORDER,
-    palette=[CO_COLOR, PD_COLOR],
-    inner=None,
-    cut=0,
-    dodge=True,
-    linewidth=0,
-    legend=False
-)
-
-# Box
-sns.boxplot(
-    data=phase_means,
-    x="Phase",
-    y="Weight",
-    hue="Group",
-    order=PHASE_ORDER,
-    width=0.25,
-    showcaps=True,
-    boxprops={"facecolor": "none"},
-    showfliers=False,
-    dodge=True,
-    legend=False
-)
+fig, ax = plt.subplots(figsize=(7,5))
 
-# Points (high contrast)
-sns.stripplot(
-    data=phase_means,
+# Violin + box + points (high contrast)
+draw_raincloud(
+    ax,
+    phase_means,
     x="Phase",
     y="Weight",
     hue="Group",
-    order=PHASE_ORDER,
-    dodge=True,
-    jitter=0.12,
-    size=6,
-    palette=[CO_COLOR, PD_COLOR],
-    edgecolor="black",
-    linewidth=0.6,
-    legend=False
+    hue_order=["CO", "PD"],
+    palette=[CO_COLOR, PD_COLOR]
 )
 
 # Paired lines
@@ -269,63 +212,10 @@ plt.xlabel("")
 plt.ylabel("Mean Body Weight (g)")
 plt.title("Body Weight by Experimental Phase")
 plt.tight_layout()
-plt.savefig(f"{OUT_DIR}/Fig_Weight_Raincloud.png", dpi=600)
-plt.show()
+plt.savefig(os.path.join(OUT_DIR, "Fig_Weight_Raincloud.pdf"), dpi=300)
+if INTERACTIVE:
+    plt.show()
+else:
+    plt.close()
 
 print("\nAll analyses, tables, and figures generated successfully.")
-
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-# Style
-sns.set(style="whitegrid", context="talk")
-
-plt.figure(figsize=(6,5))
-
-# 1) Violin plot (distribution)
-sns.violinplot(
-    data=df_pd,
-    x="Stimulation",
-    y="SucrosePreference",
-    order=["OFF", "ON"],
-    inner=None,
-    cut=0,
-    linewidth=0,
-    color="#4C72B0"   # blue tone like your figure
-)
-
-# 2) Boxplot inside violin
-sns.boxplot(
-    data=df_pd,
-    x="Stimulation",
-    y="SucrosePreference",
-    order=["OFF", "ON"],
-    width=0.25,
-    showcaps=True,
-    boxprops={"facecolor": "none", "edgecolor": "black", "linewidth": 1.4},
-    whiskerprops={"linewidth": 1.4},
-    medianprops={"color": "black", "linewidth": 1.6},
-    showfliers=False
-)
-
-# 3) Individual points (high contrast)
-sns.stripplot(
-    data=df_pd,
-    x="Stimulation",
-    y="SucrosePreference",
-    order=["OFF", "ON"],
-    jitter=0.12,
-    size=8,
-    color="#55A868",     # green dots (high contrast)
-    edgecolor="black",
-    linewidth=0.6
-)
-
-# Labels
-plt.xlabel("")
-plt.ylabel("Sucrose Preference (%)")
-plt.title("Sucrose Preference – PD Rats (DBS OFF vs ON)")
-
-plt.tight_layout()
-plt.savefig(f"{OUT_DIR}/Fig_PD_Raincloud_Final.png", dpi=600)
-plt.show()
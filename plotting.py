@@ -0,0 +1,130 @@
+# ============================================================
+# Plotting helpers – raincloud-style figures (violin + box + points)
+# Author: A. Babaei
+# ============================================================
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+def kde(vals, grid=None):
+    """
+    Gaussian KDE (Scott bandwidth) of `vals`, returned as ``(grid, density)``.
+
+    `grid` defaults to 128 points between the min and max of `vals` (like
+    cut=0).
+    """
+    k = stats.gaussian_kde(vals, bw_method="scott")
+    g = grid if grid is not None else np.linspace(vals.min(), vals.max(), 128)
+    return g, k(g)
+
+
+def _levels(df, col, order):
+    if order is not None:
+        return list(order)
+    if isinstance(df[col].dtype, pd.CategoricalDtype):
+        return list(df[col].cat.categories)
+    return list(df[col].unique())
+
+
+def draw_raincloud(ax, df, x, y, hue=None, order=None, hue_order=None,
+                   color=None, palette=None, point_color=None, point_size=6,
+                   seed=0):
+    """
+    Draw violin + box + individual points of `y` per `x` category on `ax`.
+
+    Everything is drawn with plain matplotlib calls on precomputed arrays:
+    violins are filled from kde() (cut=0) and scaled by area, boxes come from
+    ax.boxplot and all jittered points (seeded by `seed`, so figures are
+    reproducible) from a single ax.scatter call. Violins and points are
+    rasterized (axes, boxes and text stay vector in a PDF).
+    Missing values are dropped; a category with a single point or constant
+    values gets box and points but no violin.
+    """
+    order = _levels(df, x, order)
+    hue_levels = _levels(df, hue, hue_order) if hue else [None]
+
+    if isinstance(palette, dict):
+        colors = [palette[h] for h in hue_levels]
+    elif palette is not None:
+        colors = list(palette)
+    else:
+        colors = [color] * len(hue_levels)
+
+    # Split the values once per category / hue level (missing values dropped)
+    values = {}
+    for key, vals in df.groupby([x, hue] if hue else [x], observed=True, sort=False)[y]:
+        key = key if hue else (key[0], None)
+        vals = vals.dropna().to_numpy(dtype=float)
+        if vals.size:
+            values[key] = vals
+
+    width = 0.8 / len(hue_levels)
+    slots = [
+        (i + (j - (len(hue_levels) - 1) / 2) * width, (cat, level), c)
+        for i, cat in enumerate(order)
+        for j, (level, c) in enumerate(zip(hue_levels, colors))
+        if (cat, level) in values
+    ]
+    if not slots:
+        raise ValueError(f"No non-missing {y!r} values to plot for {order}")
+
+    # 1) Violins (distribution)
+    kdes = {}
+    for _, key, _ in slots:
+        vals = values[key]
+        # No violin for a single point or constant values (singular KDE)
+        if vals.size < 2 or np.ptp(vals) == 0:
+            continue
+        try:
+            kdes[key] = kde(vals)
+        except np.linalg.LinAlgError:
+            continue
+
+    peak = max((dens.max() for _, dens in kdes.values()), default=1.0)
+    for pos, key, c in slots:
+        if key not in kdes:
+            continue
+        grid, dens = kdes[key]
+        half = dens / peak * width / 2
+        ax.fill_betweenx(grid, pos - half, pos + half, color=c, linewidth=0,
+                         rasterized=True)
+
+    # 2) Boxplot inside violin
+    ax.boxplot(
+        [values[key] for _, key, _ in slots],
+        positions=[pos for pos, _, _ in slots],
+        widths=0.25 / len(hue_levels),
+        showcaps=True,
+        showfliers=False,
+        boxprops={"color": "black", "linewidth": 1.4},
+        whiskerprops={"color": "black", "linewidth": 1.4},
+        capprops={"color": "black", "linewidth": 1.4},
+        medianprops={"color": "black", "linewidth": 1.6},
+        manage_ticks=False
+    )
+
+    # 3) Individual points ("rain"), one PathCollection for all of them
+    rng = np.random.default_rng(seed)
+    jitter = 0.12 / len(hue_levels)
+    counts = [values[key].size for _, key, _ in slots]
+    xs = np.repeat([pos for pos, _, _ in slots], counts)
+    ax.scatter(
+        xs + rng.uniform(-jitter, jitter, xs.size),
+        np.concatenate([values[key] for _, key, _ in slots]),
+        s=point_size ** 2,
+        color=np.repeat([point_color or c or "C0" for _, _, c in slots], counts),
+        edgecolors="black",
+        linewidths=0.6,
+        zorder=3,
+        rasterized=True
+    )
+
+    ax.set_xticks(range(len(order)), labels=[str(cat) for cat in order])
+    ax.set_xlim(-0.5, len(order) - 0.5)
+    ax.xaxis.grid(False)
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+
+    return ax
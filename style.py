@@ -0,0 +1,64 @@
+# ============================================================
+# Figure style – seaborn "whitegrid" + "talk" as plain rcParams
+# Author: A. Babaei
+# ============================================================
+
+from cycler import cycler
+
+# Usage (once, at the top of a script): plt.rcParams.update(STYLE)
+STYLE = {
+    # whitegrid
+    "figure.facecolor": "white",
+    "axes.facecolor": "white",
+    "axes.edgecolor": ".8",
+    "axes.grid": True,
+    "axes.axisbelow": True,
+    "axes.labelcolor": ".15",
+    "grid.color": ".8",
+    "grid.linestyle": "-",
+    "text.color": ".15",
+    "xtick.color": ".15",
+    "ytick.color": ".15",
+    "xtick.direction": "out",
+    "ytick.direction": "out",
+    "xtick.bottom": False,
+    "ytick.left": False,
+    "lines.solid_capstyle": "round",
+    "patch.edgecolor": "w",
+    "patch.force_edgecolor": True,
+    "font.family": ["sans-serif"],
+    "font.sans-serif": ["Arial", "DejaVu Sans", "Liberation Sans",
+                        "Bitstream Vera Sans", "sans-serif"],
+
+    # "deep" palette
+    "axes.prop_cycle": cycler(color=[
+        "#4C72B0", "#DD8452", "#55A868", "#C44E52", "#8172B3",
+        "#937860", "#DA8BC3", "#8C8C8C", "#CCB974", "#64B5CD"
+    ]),
+
+    # talk context (notebook sizes × 1.5)
+    "font.size": 18,
+    "axes.labelsize": 18,
+    "axes.titlesize": 18,
+    "xtick.labelsize": 16.5,
+    "ytick.labelsize": 16.5,
+    "legend.fontsize": 16.5,
+    "legend.title_fontsize": 18,
+    "axes.linewidth": 1.875,
+    "grid.linewidth": 1.5,
+    "lines.linewidth": 2.25,
+    "lines.markersize": 9,
+    "patch.linewidth": 1.5,
+    "xtick.major.width": 1.875,
+    "ytick.major.width": 1.875,
+    "xtick.minor.width": 1.5,
+    "ytick.minor.width": 1.5,
+    "xtick.major.size": 9,
+    "ytick.major.size": 9,
+    "xtick.minor.size": 6,
+    "ytick.minor.size": 6,
+
+    # editable text in PDF / PS
+    "pdf.fonttype": 42,
+    "ps.fonttype": 42,
+}
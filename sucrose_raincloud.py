@@ -0,0 +1,72 @@
+# ============================================================
+# Sucrose Preference – PD rats, DBS OFF vs ON (raincloud)
+# Author: A. Babaei
+# ============================================================
+
+import os
+import matplotlib
+
+# False: batch run on the non-GUI Agg backend, figures are only saved.
+# True: also open them with plt.show() (set this in notebooks too).
+INTERACTIVE = False
+if not INTERACTIVE:
+    matplotlib.use("Agg")
+
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from plotting import draw_raincloud
+from style import STYLE
+
+# ============================================================
+# PATHS
+# ============================================================
+
+DATA_PATH = r"g:\Master\Experiment\Statistics\Sucrose\Sucrose_Preference.xlsx"
+OUT_DIR = r"g:\Master\Experiment\Statistics\Weights\Results"
+os.makedirs(OUT_DIR, exist_ok=True)
+
+# ============================================================
+# STYLE
+# ============================================================
+
+plt.rcParams.update(STYLE)
+
+# ============================================================
+# LOAD DATA
+# ============================================================
+
+# One row per animal and condition:
+# Group (PD / CO), Stimulation (OFF / ON), SucrosePreference (%)
+df = pd.read_excel(DATA_PATH, engine="openpyxl")
+df_pd = df[df["Group"] == "PD"]
+
+# ============================================================
+# RAINCLOUD-STYLE FIGURE: PD rats (DBS OFF / ON)
+# ============================================================
+
+fig, ax = plt.subplots(figsize=(6,5))
+
+# Violin (distribution) + box + individual points (high contrast)
+draw_raincloud(
+    ax,
+    df_pd,
+    x="Stimulation",
+    y="SucrosePreference",
+    order=["OFF", "ON"],
+    color="#4C72B0",        # blue tone like your figure
+    point_color="#55A868",  # green dots (high contrast)
+    point_size=8
+)
+
+# Labels
+plt.xlabel("")
+plt.ylabel("Sucrose Preference (%)")
+plt.title("Sucrose Preference – PD Rats (DBS OFF vs ON)")
+
+plt.tight_layout()
+plt.savefig(os.path.join(OUT_DIR, "Fig_PD_Raincloud_Final.pdf"), dpi=300)
+if INTERACTIVE:
+    plt.show()
+else:
+    plt.close()
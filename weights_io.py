@@ -0,0 +1,116 @@
+# ============================================================
+# Body weight data loading & preparation – shared by the scripts
+# Author: A. Babaei
+# ============================================================
+
+import os
+import numpy as np
+import pandas as pd
+
+WEEK_COLS = [f"Week_{i}" for i in range(1, 13)]
+GROUP_DTYPE = pd.CategoricalDtype(["PD", "CO"])
+PHASE_ORDER = ["Pre-DBS", "DBS", "Post-DBS"]
+
+# Bump whenever load_weights() or prepare() change what they return
+# (columns / dtypes / values), so the parquet sidecar and the joblib cache
+# written by older code are not reused. joblib only hashes _prepare's own
+# source, not the helpers and constants it depends on.
+SCHEMA_VERSION = 4
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+try:
+    from joblib import Memory
+    cache = Memory(CACHE_DIR, verbose=0).cache
+except ImportError:
+    # joblib is optional – without it prepare() recomputes on every run
+    def cache(func):
+        return func
+
+
+def load_weights(path):
+    """
+    Load the transposed weight workbook (Group + Week_1 … Week_12).
+
+    The first sheet is parsed once and memoized to a ``<path>.v<N>.parquet``
+    sidecar (N = SCHEMA_VERSION); later runs read the sidecar while it is
+    newer than the workbook.
+    """
+    pq = f"{path}.v{SCHEMA_VERSION}.parquet"
+    if os.path.exists(pq) and os.path.getmtime(pq) >= os.path.getmtime(path):
+        return pd.read_parquet(pq)
+
+    xl = pd.ExcelFile(
+        path,
+        engine="openpyxl",
+        engine_kwargs={"read_only": True, "data_only": True}
+    )
+    df = xl.parse(
+        xl.sheet_names[0],
+        header=0,
+        names=["Group"] + WEEK_COLS,
+        usecols=list(range(13)),
+        dtype={"Group": "string", **dict.fromkeys(WEEK_COLS, np.float64)}
+    )
+
+    unknown = df.loc[~df["Group"].isin(GROUP_DTYPE.categories), "Group"]
+    if len(unknown):
+        raise ValueError(
+            f"Unknown Group labels in {path}: {sorted(map(str, unknown.unique()))} "
+            f"(expected {list(GROUP_DTYPE.categories)})"
+        )
+    df["Group"] = df["Group"].astype(GROUP_DTYPE)
+
+    try:
+        df.to_parquet(pq)
+    except (ImportError, OSError):
+        # No parquet engine (pyarrow / fastparquet), or the data folder is
+        # read-only / locked – skip the sidecar
+        pass
+
+    return df
+
+
+def prepare(data_path):
+    """
+    Load the workbook and derive the tables both scripts start from.
+
+    Returns ``(df_wide, phase_means)``:
+      * df_wide – one row per animal: Group, Week_1 … Week_12, Subject and
+        the per-phase means (Pre-DBS, DBS, Post-DBS), float64
+      * phase_means – long table Subject / Group / Phase / Weight
+
+    The result is cached on disk with joblib, keyed on the path, the
+    workbook's modification time and SCHEMA_VERSION.
+    """
+    return _prepare(data_path, os.path.getmtime(data_path), SCHEMA_VERSION)
+
+
+@cache
+def _prepare(data_path, mtime, schema_version):
+    df = load_weights(data_path)
+
+    # Assign subject IDs (first 9 rows PD, the rest CO)
+    idx = np.arange(len(df))
+    df["Subject"] = np.char.add(
+        np.where(idx < 9, "PD_", "CO_"),
+        np.where(idx < 9, idx + 1, idx - 8).astype(str)
+    )
+
+    # Weeks 1–4, 5–8, 9–12 → one mean per subject and phase
+    # (missing weekly weights are skipped, as groupby().mean() did)
+    W = df[WEEK_COLS].to_numpy(dtype=np.float64)
+    df["Pre-DBS"] = np.nanmean(W[:, :4], axis=1)
+    df["DBS"] = np.nanmean(W[:, 4:8], axis=1)
+    df["Post-DBS"] = np.nanmean(W[:, 8:12], axis=1)
+
+    phase_means = pd.DataFrame({
+        "Subject": np.repeat(df["Subject"].to_numpy(), 3),
+        "Group": df["Group"].array.repeat(3),
+        "Phase": pd.Categorical.from_codes(
+            np.tile([0, 1, 2], len(df)), categories=PHASE_ORDER, ordered=True
+        ),
+        "Weight": df[PHASE_ORDER].to_numpy().ravel()
+    })
+
+    return df, phase_means
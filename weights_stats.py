@@ -0,0 +1,21 @@
+# ============================================================
+# Paired-comparison statistics – shared by the analysis scripts
+# Author: A. Babaei
+# ============================================================
+
+import numpy as np
+
+
+def paired_t(x, y):
+    """
+    Paired t statistic and Cohen's dz for each row of `x` vs `y`.
+
+    `x` and `y` are float64 arrays of shape (comparisons, subjects). t uses
+    the stats.ttest_rel(x, y) sign convention, dz = mean(y - x) / sd(y - x).
+    p-values are left to the caller (stats.t.sf with n - 1 df).
+    """
+    d = y - x
+    n = d.shape[1]
+    m = d.mean(axis=1)
+    sd = d.std(ddof=1, axis=1)
+    return -m / (sd / np.sqrt(n)), m / sd